@@ -22,7 +22,8 @@ The MCP server exposes migration operations as tools that AI assistants can call
 - migration_create: Create new migration files
 - migration_list: List all registered migrations
 
-The server reads from stdin and writes to stdout using JSON-RPC protocol.`,
+The server reads from stdin and writes to stdout using JSON-RPC protocol.
+If MCP_FD is set, it uses that inherited socket file descriptor instead.`,
 	Run: runMCP,
 }
 
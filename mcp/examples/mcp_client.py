@@ -11,194 +11,575 @@ Commands:
     up [version]    - Apply migrations (optionally up to version)
     down [version]  - Roll back migrations (optionally to version)
     create <name> <description> - Create a new migration
+    create-batch @<file.json>   - Create every migration in a JSON array of
+                                  {"name": ..., "description": ...} objects
     list            - List all registered migrations
     interactive     - Interactive mode with command prompt
+
+JSON-RPC messages are encoded with orjson when it is installed, and interactive
+mode uses prompt_toolkit for history and tab completion when it is installed.
 """
 
+import asyncio
 import json
 import subprocess
 import sys
 import argparse
 import os
-from typing import Optional, Dict, Any
+import shlex
+import shutil
+import socket
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON."""
+        return orjson.dumps(obj)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    json_loads = json.loads
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+except ImportError:
+    PromptSession = None
+
+# Pre-encoded request lines for methods that never take params; only the id varies
+REQUEST_TEMPLATES = {
+    method: b'{"jsonrpc":"2.0","id":%d,"method":"' + method.encode() + b'","params":{}}\n'
+    for method in ("initialize", "tools/list")
+}
+
+# Pre-encoded tools/call envelopes for the known tools, up to the arguments object
+TOOL_CALL_PREFIXES = {
+    tool: b'{"jsonrpc":"2.0","id":%d,"method":"tools/call","params":{"name":"' + tool.encode() + b'","arguments":'
+    for tool in ("migration_status", "migration_up", "migration_down", "migration_create", "migration_list")
+}
+
+def encode_request(request_id: int, method: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+    """Encode a JSON-RPC request line, using a pre-encoded envelope when one applies."""
+    if not params and method in REQUEST_TEMPLATES:
+        return REQUEST_TEMPLATES[method] % request_id
+    if (method == "tools/call" and params and params.get('name') in TOOL_CALL_PREFIXES
+            and params.keys() == {'name', 'arguments'}):
+        # Only the arguments object needs encoding; it is appended after formatting the id
+        arguments = params['arguments']
+        prefix = TOOL_CALL_PREFIXES[params['name']] % request_id
+        return prefix + (json_dumps(arguments) if arguments else b'{}') + b'}}\n'
+    return json_dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": method,
+        "params": params or {}
+    }) + b'\n'
+
+# Socket buffer size for the Unix socket transport, and read chunk size
+SOCKET_BUFFER_SIZE = 1 << 20
+SOCKET_READ_SIZE = 64 * 1024
+
+# On-disk cache of tools/list results, keyed by server version and binary path/mtime
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'mcp-mongo-essential')
+TOOLS_CACHE_PATH = os.path.join(CACHE_DIR, 'tools.json')
+
+# Tools that only read state, so their responses can be briefly reused
+READ_ONLY_TOOLS = {"migration_status", "migration_list"}
+
+# Fallback text and failure message for each tool's response
+TOOL_MESSAGES = {
+    "migration_status": ('No status available', "❌ Failed to get migration status"),
+    "migration_up": ('Migration completed', "❌ Failed to run migrations"),
+    "migration_down": ('Migration rolled back', "❌ Failed to roll back migrations"),
+    "migration_create": ('Migration created', "❌ Failed to create migration"),
+    "migration_list": ('No migrations found', "❌ Failed to list migrations"),
+}
 
 class MCPClient:
-    def __init__(self, mcp_binary_path: str = "./build/mongo-essential"):
+    def __init__(self, mcp_binary_path: str = "./build/mongo-essential", transport: str = "socket",
+                 capture_stderr: bool = False, cache_ttl: float = 2.0):
         self.mcp_binary_path = mcp_binary_path
+        self.transport = transport
+        self.capture_stderr = capture_stderr
+        self.cache_ttl = cache_ttl
         self.request_id = 0
+        self._proc: Optional[subprocess.Popen] = None
+        self._command: Optional[List[str]] = None
+        self._sock: Optional[socket.socket] = None
+        self._sock_answered = False
+        self._rbuf = bytearray()
+        # Preallocated receive buffer reused by every recv_into() on the socket
+        self._recv_buf = memoryview(bytearray(SOCKET_READ_SIZE))
+        # Tool definitions are static per server version, so tools/list is fetched once
+        self._server_version: Optional[str] = None
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_version: Optional[str] = None
+        # Recent read-only tool responses: key -> (monotonic timestamp, response)
+        self._cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        # Interactive command handlers, each given the arguments after the command word
+        self._dispatch: Dict[str, Callable[[List[str]], Any]] = {
+            'help': lambda _args: self._print_help(),
+            'h': lambda _args: self._print_help(),
+            'tools': lambda args: self.list_tools(refresh='--refresh' in args),
+            'status': lambda _args: self.migration_status(),
+            'up': lambda args: self.migration_up(args[0] if args else None),
+            'down': lambda args: self.migration_down(args[0] if args else None),
+            'create': self._create_command,
+            'list': lambda _args: self.list_migrations(),
+        }
+
+    def __enter__(self) -> "MCPClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def _next_id(self) -> int:
         """Get next request ID."""
         self.request_id += 1
         return self.request_id
 
-    def _run_mcp_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        """Run an MCP request and return the response."""
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": method,
-            "params": params or {}
-        }
+    def _ensure_proc(self) -> subprocess.Popen:
+        """Start the MCP server on first use and keep it running between requests."""
+        if self._proc is None or self._proc.poll() is not None:
+            self.close()
+            if self.transport == "socket" and hasattr(socket, "AF_UNIX"):
+                self._proc = self._spawn_socket()
+            else:
+                self._proc = subprocess.Popen(
+                    self._server_command(),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=self._stderr_target()
+                )
+            if self.capture_stderr:
+                # Drain stderr in the background so a chatty server never blocks on a full pipe
+                threading.Thread(target=self._drain_stderr, args=(self._proc.stderr,), daemon=True).start()
+        return self._proc
+
+    def _stderr_target(self) -> int:
+        """Server stderr is only piped back when it will be shown."""
+        return subprocess.PIPE if self.capture_stderr else subprocess.DEVNULL
+
+    def _server_command(self) -> List[str]:
+        """Build the server command line, resolving a bare binary name on PATH only once."""
+        if self._command is None:
+            binary = self.mcp_binary_path
+            if os.sep not in binary:
+                binary = shutil.which(binary) or binary
+            self._command = [binary, "mcp", "--with-examples"]
+        return self._command
+
+    def _spawn_socket(self) -> subprocess.Popen:
+        """Start the MCP server talking JSON-RPC over a Unix socketpair passed as MCP_FD."""
+        parent, child = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        for sock in (parent, child):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
         
         try:
-            process = subprocess.Popen(
-                [self.mcp_binary_path, "mcp", "--with-examples"],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            # stdin is closed so a server without MCP_FD support exits at once and we fall back to pipes
+            proc = subprocess.Popen(
+                self._server_command(),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=self._stderr_target(),
+                pass_fds=(child.fileno(),),
+                env=dict(os.environ, MCP_FD=str(child.fileno()))
             )
+        except BaseException:
+            parent.close()
+            raise
+        finally:
+            child.close()
+        
+        self._sock = parent
+        self._sock_answered = False
+        self._rbuf.clear()
+        return proc
+
+    @staticmethod
+    def _drain_stderr(stream) -> None:
+        """Forward MCP server stderr output."""
+        for line in stream:
+            if line.strip():
+                print(f"MCP Server Error: {line.decode(errors='replace').strip()}", file=sys.stderr)
+
+    def close(self) -> None:
+        """Shut down the MCP server subprocess."""
+        sock, self._sock = self._sock, None
+        if self._proc is None:
+            if sock is not None:
+                sock.close()
+            return
+        proc, self._proc = self._proc, None
+        try:
+            # The server exits on EOF
+            if sock is not None:
+                sock.close()
+            else:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def _wait_exit(self, timeout: float = 5) -> Optional[int]:
+        """Wait for a server that closed its connection to exit, returning its exit status."""
+        try:
+            return self._proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
+    def _write(self, data: bytes) -> None:
+        """Write raw request data to the server."""
+        if self._sock is not None:
+            self._sock.sendall(data)
+        else:
+            self._proc.stdin.write(data)
+            self._proc.stdin.flush()
+
+    def _readline(self) -> bytes:
+        """Read one raw response line from the server, or an empty buffer at EOF."""
+        if self._sock is None:
+            return self._proc.stdout.readline()
+        
+        scanned = 0
+        while True:
+            end = self._rbuf.find(b'\n', scanned)
+            if end >= 0:
+                line = self._rbuf[:end + 1]
+                del self._rbuf[:end + 1]
+                self._sock_answered = True
+                return line
+            scanned = len(self._rbuf)
+            received = self._sock.recv_into(self._recv_buf)
+            if not received:
+                line = bytes(self._rbuf)
+                self._rbuf.clear()
+                return line
+            self._rbuf += self._recv_buf[:received]
+
+    def _roundtrip(self, payload: bytes, count: int) -> List[bytes]:
+        """Write a payload and read up to count response lines, stopping early at EOF."""
+        self._ensure_proc()
+        if count == 1:
+            self._write(payload)
+            writer = None
+        else:
+            # The server answers each line as it reads it, so a large batch must be written while
+            # responses are drained; otherwise both sides block once the response buffer fills
+            write_errors: List[OSError] = []
+            writer = threading.Thread(target=self._write_all, args=(payload, write_errors), daemon=True)
+            writer.start()
+        
+        lines = []
+        while len(lines) < count:
+            line = self._readline()
+            if not line:
+                break
+            lines.append(line)
+        
+        if writer is not None:
+            writer.join()
+            if write_errors:
+                raise write_errors[0]
+        return lines
+
+    def _write_all(self, payload: bytes, errors: List[OSError]) -> None:
+        """Write a payload from a background thread, recording any failure for the reader."""
+        try:
+            self._write(payload)
+        except OSError as e:
+            errors.append(e)
+
+    def _encode(self, method: str, params: Optional[Dict[str, Any]] = None) -> Tuple[int, bytes]:
+        """Assign the next request ID and encode the request line."""
+        request_id = self._next_id()
+        return request_id, encode_request(request_id, method, params)
+
+    def _exchange(self, requests: List[Tuple[int, bytes]]) -> Dict[Any, Dict[str, Any]]:
+        """Write encoded requests in a single write and read one response line per request, keyed by id."""
+        payload = b''.join(line for _, line in requests)
+        try:
+            self._ensure_proc()
+            probing = self._sock is not None and not self._sock_answered
+            try:
+                lines = self._roundtrip(payload, len(requests))
+            except (BrokenPipeError, ConnectionResetError):
+                if not probing:
+                    raise
+                lines = []
             
-            # Send request and get response
-            stdout, stderr = process.communicate(json.dumps(request) + '\n')
-            
-            if stderr.strip():
-                print(f"MCP Server Error: {stderr.strip()}", file=sys.stderr)
+            if probing and not lines:
+                status = self._wait_exit()
+                if status == 0:
+                    # The server ignored MCP_FD and exited cleanly on its closed stdin: switch to pipes
+                    self.close()
+                    self.transport = "pipe"
+                    lines = self._roundtrip(payload, len(requests))
+                elif status is not None:
+                    # A crashed server may already have acted on the requests, so never replay them
+                    print(f"MCP server exited with status {status}", file=sys.stderr)
             
-            if not stdout.strip():
+            if len(lines) < len(requests):
                 print("No response from MCP server", file=sys.stderr)
-                return None
+                if not self.capture_stderr:
+                    print("Re-run with --debug to see server errors", file=sys.stderr)
             
-            try:
-                return json.loads(stdout.strip())
-            except json.JSONDecodeError as e:
-                print(f"Failed to parse JSON response: {e}", file=sys.stderr)
-                print(f"Raw response: {stdout}", file=sys.stderr)
-                return None
+            responses = {}
+            for line in lines:
+                try:
+                    response = json_loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"Failed to parse JSON response: {e}", file=sys.stderr)
+                    print(f"Raw response: {line.decode(errors='replace')}", file=sys.stderr)
+                    continue
+                responses[response.get('id')] = response
+            return responses
                 
         except FileNotFoundError:
             print(f"MCP binary not found at {self.mcp_binary_path}", file=sys.stderr)
             print("Build the binary with: make build", file=sys.stderr)
-            return None
+            return {}
         except Exception as e:
             print(f"Error running MCP request: {e}", file=sys.stderr)
+            return {}
+
+    def _run_mcp_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Run an MCP request and return the response."""
+        request_id, line = self._encode(method, params)
+        return self._exchange([(request_id, line)]).get(request_id)
+
+    def batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Optional[Dict[str, Any]]]:
+        """Send several requests in one round-trip and return their responses in call order.
+
+        The server reads one request per line, so the batch is written as
+        newline-delimited requests and the responses are matched back up by id.
+        """
+        if not calls:
+            return []
+        if any(method == "tools/call" and self._read_only_key(method, params) is None for method, params in calls):
+            self._cache.clear()
+        requests = [self._encode(method, params) for method, params in calls]
+        responses = self._exchange(requests)
+        return [responses.get(request_id) for request_id, _ in requests]
+
+    @staticmethod
+    def _read_only_key(method: str, params: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+        """Return the cache key for a read-only tool call, or None for anything else."""
+        params = params or {}
+        if method != "tools/call" or params.get('name') not in READ_ONLY_TOOLS:
             return None
+        return params['name'], frozenset((params.get('arguments') or {}).items())
 
-    def initialize(self) -> bool:
-        """Initialize the MCP server."""
-        print("Initializing MCP server...")
-        response = self._run_mcp_request("initialize")
+    def _cached_call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Run a request, reusing read-only responses younger than cache_ttl seconds."""
+        key = self._read_only_key(method, params)
+        if key is None:
+            if method == "tools/call":
+                # Any other tool may change migration state
+                self._cache.clear()
+            return self._run_mcp_request(method, params)
+        
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
         
+        response = self._run_mcp_request(method, params)
+        if response and 'result' in response:
+            self._cache[key] = (now, response)
+        return response
+
+    @staticmethod
+    def tool_call(tool: str, **arguments: Any) -> Tuple[str, Dict[str, Any]]:
+        """Build the method and params for a tools/call request, dropping unset arguments."""
+        return "tools/call", {
+            "name": tool,
+            "arguments": {key: value for key, value in arguments.items() if value}
+        }
+
+    def run(self, method: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """Run a request and print its result."""
+        return self._show_response(method, params, self._cached_call(method, params))
+
+    def _show_response(self, method: str, params: Optional[Dict[str, Any]], response: Optional[Dict[str, Any]]) -> bool:
+        """Print a response according to the request that produced it."""
+        if method == "initialize":
+            return self._show_initialize(response)
+        if method == "tools/list":
+            return self._show_tools(response)
+        
+        default, failure = TOOL_MESSAGES.get((params or {}).get('name'), ('Done', "❌ Tool call failed"))
+        if response and 'result' in response:
+            content = response['result'].get('content', [])
+            if content and len(content) > 0:
+                print("\n" + content[0].get('text', default))
+                return True
+        
+        print(failure)
+        return False
+
+    def _show_initialize(self, response: Optional[Dict[str, Any]]) -> bool:
+        """Record the server version and print the result of an initialize request."""
         if response and 'result' in response:
             server_info = response['result'].get('serverInfo', {})
+            self._server_version = server_info.get('version')
+            if self._tools_version not in (None, self._server_version):
+                # Tools were cached for another server version
+                self._tools_cache = self._tools_version = None
+            if self._tools_cache is None:
+                self._load_tools_cache()
             print(f"✅ Connected to {server_info.get('name', 'mongo-essential')} v{server_info.get('version', 'unknown')}")
             return True
         else:
             print("❌ Failed to initialize MCP server")
             return False
 
-    def list_tools(self) -> bool:
-        """List available tools."""
-        print("Listing available tools...")
-        response = self._run_mcp_request("tools/list")
-        
-        if response and 'result' in response:
-            tools = response['result'].get('tools', [])
-            print(f"\n📋 Available Tools ({len(tools)}):")
-            print("=" * 50)
-            for tool in tools:
-                print(f"🔧 {tool['name']}")
-                print(f"   {tool['description']}")
-                print()
-            return True
+    def _show_tools(self, response: Optional[Dict[str, Any]]) -> bool:
+        """Cache and print the result of a tools/list request."""
+        if self._store_tools(response):
+            return self._print_tools(self._tools_cache)
         else:
             print("❌ Failed to list tools")
             return False
 
+    def _store_tools(self, response: Optional[Dict[str, Any]]) -> bool:
+        """Cache the tools from a tools/list response in memory and on disk."""
+        if not (response and 'result' in response):
+            return False
+        self._tools_cache = response['result'].get('tools', [])
+        self._tools_version = self._server_version
+        self._save_tools_cache()
+        return True
+
+    def _print_tools(self, tools: List[Dict[str, Any]]) -> bool:
+        """Print tool definitions in a single write."""
+        out = [f"\n📋 Available Tools ({len(tools)}):\n", "=" * 50, "\n"]
+        out.extend(f"🔧 {tool['name']}\n   {tool['description']}\n\n" for tool in tools)
+        sys.stdout.write(''.join(out))
+        return True
+
+    def _tools_cache_key(self) -> Optional[Dict[str, Any]]:
+        """Identify the server build: the binary's path and mtime, plus its version once reported.
+
+        The server hardcodes its version, so a rebuilt binary is only detected by its mtime;
+        that also lets the cache be checked before the server has been asked anything.
+        """
+        binary = self._server_command()[0]
+        try:
+            mtime = os.stat(binary).st_mtime
+        except OSError:
+            return None
+        key = {'binary': os.path.abspath(binary), 'mtime': mtime}
+        if self._server_version is not None:
+            key['version'] = self._server_version
+        return key
+
+    def _load_tools_cache(self) -> None:
+        """Load cached tool definitions from disk if they match the server build."""
+        key = self._tools_cache_key()
+        if key is None:
+            return
+        try:
+            with open(TOOLS_CACHE_PATH) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not (isinstance(cache, dict) and isinstance(cache.get('key'), dict)):
+            return
+        cached_key = cache['key']
+        if all(cached_key.get(field) == value for field, value in key.items()):
+            self._tools_cache = cache.get('tools')
+            self._tools_version = cached_key.get('version')
+
+    def _save_tools_cache(self) -> None:
+        """Persist tool definitions to disk, replacing the old cache atomically."""
+        key = self._tools_cache_key()
+        if key is None or 'version' not in key:
+            return
+        tmp_path = f"{TOOLS_CACHE_PATH}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'key': key, 'tools': self._tools_cache}, f)
+            os.replace(tmp_path, TOOLS_CACHE_PATH)
+        except OSError:
+            # The cache is only an optimisation
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def initialize(self) -> bool:
+        """Initialize the MCP server."""
+        print("Initializing MCP server...")
+        return self.run("initialize")
+
+    def list_tools(self, refresh: bool = False) -> bool:
+        """List available tools, from the cache unless refresh is set."""
+        print("Listing available tools...")
+        if self._tools_cache is None or refresh:
+            return self.run("tools/list")
+        return self._print_tools(self._tools_cache)
+
+    def refresh_tools(self) -> bool:
+        """Re-fetch and list available tools, bypassing the cache."""
+        return self.list_tools(refresh=True)
+
     def migration_status(self) -> bool:
         """Get migration status."""
         print("Getting migration status...")
-        response = self._run_mcp_request("tools/call", {
-            "name": "migration_status",
-            "arguments": {}
-        })
-        
-        if response and 'result' in response:
-            content = response['result'].get('content', [])
-            if content and len(content) > 0:
-                print("\n" + content[0].get('text', 'No status available'))
-                return True
-        
-        print("❌ Failed to get migration status")
-        return False
+        return self.run(*self.tool_call("migration_status"))
 
     def migration_up(self, version: Optional[str] = None) -> bool:
         """Apply migrations."""
-        args = {"version": version} if version else {}
         action = f"up to version {version}" if version else "up (all pending)"
         
         print(f"Running migrations {action}...")
-        response = self._run_mcp_request("tools/call", {
-            "name": "migration_up",
-            "arguments": args
-        })
-        
-        if response and 'result' in response:
-            content = response['result'].get('content', [])
-            if content and len(content) > 0:
-                print("\n" + content[0].get('text', 'Migration completed'))
-                return True
-        
-        print("❌ Failed to run migrations")
-        return False
+        return self.run(*self.tool_call("migration_up", version=version))
 
     def migration_down(self, version: Optional[str] = None) -> bool:
         """Roll back migrations."""
-        args = {"version": version} if version else {}
         action = f"down to version {version}" if version else "down (last migration)"
         
         print(f"Rolling back migrations {action}...")
-        response = self._run_mcp_request("tools/call", {
-            "name": "migration_down",
-            "arguments": args
-        })
-        
-        if response and 'result' in response:
-            content = response['result'].get('content', [])
-            if content and len(content) > 0:
-                print("\n" + content[0].get('text', 'Migration rolled back'))
-                return True
-        
-        print("❌ Failed to roll back migrations")
-        return False
+        return self.run(*self.tool_call("migration_down", version=version))
 
     def create_migration(self, name: str, description: str) -> bool:
         """Create a new migration."""
         print(f"Creating migration: {name}")
-        response = self._run_mcp_request("tools/call", {
-            "name": "migration_create",
-            "arguments": {
-                "name": name,
-                "description": description
-            }
-        })
-        
-        if response and 'result' in response:
-            content = response['result'].get('content', [])
-            if content and len(content) > 0:
-                print("\n" + content[0].get('text', 'Migration created'))
-                return True
-        
-        print("❌ Failed to create migration")
-        return False
+        return self.run(*self.tool_call("migration_create", name=name, description=description))
+
+    def create_many(self, items: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        """Create several migrations from (name, description) pairs in one batch."""
+        return self.batch([
+            self.tool_call("migration_create", name=name, description=description)
+            for name, description in items
+        ])
+
+    def create_batch(self, items: List[Tuple[str, str]]) -> bool:
+        """Create several migrations in one batch and print each result."""
+        success = True
+        for (name, _), response in zip(items, self.create_many(items)):
+            print(f"Creating migration: {name}")
+            success = self._show_response(*self.tool_call("migration_create"), response) and success
+        return success
 
     def list_migrations(self) -> bool:
         """List all registered migrations."""
         print("Listing registered migrations...")
-        response = self._run_mcp_request("tools/call", {
-            "name": "migration_list",
-            "arguments": {}
-        })
-        
-        if response and 'result' in response:
-            content = response['result'].get('content', [])
-            if content and len(content) > 0:
-                print("\n" + content[0].get('text', 'No migrations found'))
-                return True
-        
-        print("❌ Failed to list migrations")
-        return False
+        return self.run(*self.tool_call("migration_list"))
 
     def interactive_mode(self):
         """Run in interactive mode."""
@@ -206,49 +587,45 @@ class MCPClient:
         print("Type 'help' for available commands, 'quit' to exit")
         print()
         
-        # Initialize server once
-        if not self.initialize():
-            return
+        # Tools for completion come from the disk cache when it matches the binary; on a miss
+        # they are fetched in the same write as initialize
+        if self._tools_cache is None:
+            self._load_tools_cache()
+        if self._tools_cache is None:
+            print("Initializing MCP server...")
+            init_response, tools_response = self.batch([("initialize", {}), ("tools/list", {})])
+            if not self._show_initialize(init_response):
+                return
+            self._store_tools(tools_response)
+        else:
+            if not self.initialize():
+                return
+            if self._tools_cache is None:
+                # The cached tools were for a different server version
+                self._store_tools(self._run_mcp_request("tools/list"))
         
+        read_command = self._command_reader()
         while True:
             try:
-                command = input("mcp> ").strip()
+                command = read_command().strip()
                 
-                if command in ['quit', 'exit', 'q']:
+                try:
+                    tokens = shlex.split(command)
+                except ValueError as e:
+                    print(f"Invalid command: {e}")
+                    continue
+                
+                if not tokens:
+                    continue
+                elif tokens[0] in ['quit', 'exit', 'q']:
                     print("Goodbye! 👋")
                     break
-                elif command in ['help', 'h']:
-                    self._print_help()
-                elif command == 'tools':
-                    self.list_tools()
-                elif command == 'status':
-                    self.migration_status()
-                elif command == 'up':
-                    self.migration_up()
-                elif command.startswith('up '):
-                    version = command.split(' ', 1)[1]
-                    self.migration_up(version)
-                elif command == 'down':
-                    self.migration_down()
-                elif command.startswith('down '):
-                    version = command.split(' ', 1)[1]
-                    self.migration_down(version)
-                elif command.startswith('create '):
-                    parts = command.split(' ', 2)
-                    if len(parts) < 3:
-                        print("Usage: create <name> <description>")
-                    else:
-                        name_desc = parts[2].split(' ', 1)
-                        if len(name_desc) < 2:
-                            print("Usage: create <name> <description>")
-                        else:
-                            self.create_migration(name_desc[0], name_desc[1])
-                elif command == 'list':
-                    self.list_migrations()
-                elif command == '':
-                    continue
-                else:
+                
+                handler = self._dispatch.get(tokens[0])
+                if handler is None:
                     print(f"Unknown command: {command}. Type 'help' for available commands.")
+                else:
+                    handler(tokens[1:])
                     
                 print()  # Add spacing between commands
                 
@@ -259,12 +636,29 @@ class MCPClient:
                 print("\nGoodbye! 👋")
                 break
 
+    def _command_reader(self) -> Callable[[], str]:
+        """Return a prompt function, with history and completion when prompt_toolkit is available."""
+        if PromptSession is None or not sys.stdin.isatty():
+            return lambda: input("mcp> ")
+        
+        words = list(self._dispatch) + ['quit', 'exit', '--refresh']
+        words += [tool['name'] for tool in self._tools_cache or []]
+        session = PromptSession(completer=WordCompleter(words))
+        return lambda: session.prompt("mcp> ")
+
+    def _create_command(self, args: List[str]) -> None:
+        """Handle the interactive create command."""
+        if len(args) < 2:
+            print("Usage: create <name> <description>")
+        else:
+            self.create_migration(args[0], ' '.join(args[1:]))
+
     def _print_help(self):
         """Print help information."""
-        print("""
+        sys.stdout.write("""
 Available commands:
   help                     - Show this help
-  tools                    - List available MCP tools
+  tools [--refresh]        - List available MCP tools (--refresh bypasses the cache)
   status                   - Get migration status
   up [version]             - Apply migrations (optionally up to version)
   down [version]           - Roll back migrations (optionally to version)
@@ -278,61 +672,217 @@ Examples:
   up 20240101_001          - Apply migrations up to specific version
   down                     - Roll back the last applied migration
   create add_index "Add user email index" - Create a new migration
+
 """)
 
+class AsyncMCPClient:
+    """asyncio MCP client that keeps many requests in flight over one server process.
+
+    Example:
+        async with AsyncMCPClient() as client:
+            status, migrations = await asyncio.gather(
+                client.call(*MCPClient.tool_call("migration_status")),
+                client.call(*MCPClient.tool_call("migration_list")),
+            )
+    """
+
+    def __init__(self, mcp_binary_path: str = "./build/mongo-essential", capture_stderr: bool = False):
+        self.mcp_binary_path = mcp_binary_path
+        self.capture_stderr = capture_stderr
+        self.request_id = 0
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._started: Optional[asyncio.Future] = None
+        self._readers: List[asyncio.Future] = []
+        self._pending: Dict[int, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncMCPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _next_id(self) -> int:
+        """Get next request ID."""
+        self.request_id += 1
+        return self.request_id
+
+    async def _ensure_proc(self) -> None:
+        """Start the MCP server once, even when several calls race to use it."""
+        started = self._started
+        if started is None or (started.done() and (started.cancelled() or started.exception() is not None)):
+            self._started = started = asyncio.ensure_future(self._start())
+        # Shield the shared startup so cancelling one caller doesn't cancel it for the others
+        await asyncio.shield(started)
+
+    async def _start(self) -> None:
+        """Spawn the MCP server and start reading its output."""
+        self._proc = await asyncio.create_subprocess_exec(
+            self.mcp_binary_path, "mcp", "--with-examples",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if self.capture_stderr else asyncio.subprocess.DEVNULL,
+            limit=1 << 20
+        )
+        self._readers = [asyncio.ensure_future(self._read_responses(self._proc.stdout))]
+        if self.capture_stderr:
+            self._readers.append(asyncio.ensure_future(self._drain_stderr(self._proc.stderr)))
+
+    async def _read_responses(self, stream: asyncio.StreamReader) -> None:
+        """Resolve pending calls as their responses arrive, in whatever order."""
+        try:
+            while True:
+                line = await self._read_line(stream)
+                if not line:
+                    break
+                try:
+                    response = json_loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"Failed to parse JSON response: {e}", file=sys.stderr)
+                    print(f"Raw response: {line!r}", file=sys.stderr)
+                    continue
+                if not isinstance(response, dict):
+                    print(f"Unexpected response from MCP server: {line!r}", file=sys.stderr)
+                    continue
+                future = self._pending.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            print(f"Error reading MCP response: {e}", file=sys.stderr)
+        finally:
+            # Reader is done: release everything still waiting
+            if self._pending:
+                print("No response from MCP server", file=sys.stderr)
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_result(None)
+            self._pending.clear()
+
+    @staticmethod
+    async def _read_line(stream: asyncio.StreamReader) -> bytes:
+        """Read one line of any length, reading past the stream's buffer limit if needed."""
+        chunks = []
+        while True:
+            try:
+                chunks.append(await stream.readuntil(b'\n'))
+                return b''.join(chunks)
+            except asyncio.LimitOverrunError as e:
+                chunks.append(await stream.readexactly(e.consumed))
+            except asyncio.IncompleteReadError as e:
+                chunks.append(e.partial)
+                return b''.join(chunks)
+
+    @staticmethod
+    async def _drain_stderr(stream: asyncio.StreamReader) -> None:
+        """Forward MCP server stderr output."""
+        async for line in stream:
+            if line.strip():
+                print(f"MCP Server Error: {line.decode(errors='replace').strip()}", file=sys.stderr)
+
+    async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Send a request and wait for its response while other calls stay in flight."""
+        try:
+            await self._ensure_proc()
+        except FileNotFoundError:
+            print(f"MCP binary not found at {self.mcp_binary_path}", file=sys.stderr)
+            print("Build the binary with: make build", file=sys.stderr)
+            return None
+        
+        if self._readers[0].done():
+            print("No response from MCP server", file=sys.stderr)
+            return None
+        
+        request_id = self._next_id()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        
+        try:
+            # write() only buffers, so concurrent calls never interleave partial lines
+            self._proc.stdin.write(encode_request(request_id, method, params))
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self._pending.pop(request_id, None)
+            print(f"Error running MCP request: {e}", file=sys.stderr)
+            return None
+        
+        return await future
+
+    async def close(self) -> None:
+        """Shut down the MCP server subprocess."""
+        if self._proc is None:
+            return
+        proc, self._proc, self._started = self._proc, None, None
+        proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+        await asyncio.gather(*self._readers)
+        self._readers = []
+
 def main():
     parser = argparse.ArgumentParser(description="MCP client for mongo-essential")
     parser.add_argument('--binary', default='./build/mongo-essential',
                         help='Path to mongo-essential binary')
+    parser.add_argument('--transport', choices=['socket', 'pipe'], default='socket',
+                        help='Talk to the server over a Unix socketpair (falls back to pipes) or stdin/stdout pipes')
+    parser.add_argument('--debug', action='store_true',
+                        help='Show MCP server stderr output')
     parser.add_argument('command', nargs='?',
-                        choices=['init', 'tools', 'status', 'up', 'down', 'create', 'list', 'interactive'],
+                        choices=['init', 'tools', 'status', 'up', 'down', 'create', 'create-batch', 'list',
+                                 'interactive'],
                         help='Command to run')
     parser.add_argument('args', nargs='*', help='Command arguments')
 
     args = parser.parse_args()
 
-    # Check if binary exists
-    if not os.path.exists(args.binary):
-        print(f"Error: Binary not found at {args.binary}")
-        print("Build it with: make build")
-        sys.exit(1)
-
-    client = MCPClient(args.binary)
-
-    if not args.command or args.command == 'interactive':
-        client.interactive_mode()
-        return
-
-    success = False
-
-    needs_init = args.command not in ['init']
-    if needs_init and not client.initialize():
-        sys.exit(1)
-
-    if args.command == 'init':
-        success = client.initialize()
-    elif args.command == 'tools':
-        success = client.list_tools()
-    elif args.command == 'status':
-        success = client.migration_status()
-    elif args.command == 'up':
-        version = args.args[0] if args.args else None
-        success = client.migration_up(version)
-    elif args.command == 'down':
-        version = args.args[0] if args.args else None
-        success = client.migration_down(version)
-    elif args.command == 'create':
-        if len(args.args) < 2:
-            print("Usage: create <name> <description>")
-            sys.exit(1)
-        success = client.create_migration(args.args[0], ' '.join(args.args[1:]))
-    elif args.command == 'list':
-        success = client.list_migrations()
+    # A missing binary is reported when the server is first spawned
+    with MCPClient(args.binary, args.transport, capture_stderr=args.debug) as client:
+        if not args.command or args.command == 'interactive':
+            client.interactive_mode()
+            return
+
+        # The server needs no initialize handshake before a single command
+        success = False
+        if args.command == 'init':
+            success = client.initialize()
+        elif args.command == 'tools':
+            success = client.list_tools()
+        elif args.command == 'status':
+            success = client.migration_status()
+        elif args.command == 'up':
+            version = args.args[0] if args.args else None
+            success = client.migration_up(version)
+        elif args.command == 'down':
+            version = args.args[0] if args.args else None
+            success = client.migration_down(version)
+        elif args.command == 'create':
+            if len(args.args) < 2:
+                print("Usage: create <name> <description>")
+                sys.exit(1)
+            success = client.create_migration(args.args[0], ' '.join(args.args[1:]))
+        elif args.command == 'create-batch':
+            success = _create_batch(client, args.args)
+        elif args.command == 'list':
+            success = client.list_migrations()
 
     sys.exit(0 if success else 1)
 
-if __name__ == "__main__":
-    main()
+def _create_batch(client: MCPClient, args: List[str]) -> bool:
+    """Create every migration listed in a JSON file in a single batch."""
+    if len(args) != 1:
+        print("Usage: create-batch @<file.json>")
+        return False
+    
+    path = args[0][1:] if args[0].startswith('@') else args[0]
+    try:
+        with open(path) as f:
+            items = [(item['name'], item['description']) for item in json.load(f)]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Failed to read migrations from {path}: {e}")
+        return False
+    
+    return client.create_batch(items)
 
 if __name__ == "__main__":
     main()
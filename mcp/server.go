@@ -8,6 +8,7 @@ import (
 	"io"
 	"log"
 	"os"
+	"strconv"
 	"strings"
 	"time"
 
@@ -125,8 +126,13 @@ func (s *MCPServer) RegisterMigrations(migrations ...migration.Migration) {
 
 // Start starts the MCP server
 func (s *MCPServer) Start() error {
-	decoder := json.NewDecoder(os.Stdin)
-	encoder := json.NewEncoder(os.Stdout)
+	in, out, err := transport()
+	if err != nil {
+		return err
+	}
+
+	decoder := json.NewDecoder(in)
+	encoder := json.NewEncoder(out)
 
 	for {
 		var request MCPRequest
@@ -147,6 +153,30 @@ func (s *MCPServer) Start() error {
 	return nil
 }
 
+// transport returns the stream the server speaks JSON-RPC over: stdin/stdout by
+// default, or the inherited socket file descriptor named by MCP_FD
+func transport() (io.Reader, io.Writer, error) {
+	fd := os.Getenv("MCP_FD")
+	if fd == "" {
+		return os.Stdin, os.Stdout, nil
+	}
+
+	n, err := strconv.Atoi(fd)
+	if err != nil {
+		return nil, nil, fmt.Errorf("invalid MCP_FD %q: %w", fd, err)
+	}
+
+	conn := os.NewFile(uintptr(n), "mcp-socket")
+	if conn == nil {
+		return nil, nil, fmt.Errorf("invalid MCP_FD %q", fd)
+	}
+	// NewFile doesn't check the descriptor; a closed one would make every read fail immediately
+	if _, err := conn.Stat(); err != nil {
+		return nil, nil, fmt.Errorf("invalid MCP_FD %q: %w", fd, err)
+	}
+	return conn, conn, nil
+}
+
 // handleRequest handles an MCP request
 func (s *MCPServer) handleRequest(request *MCPRequest) *MCPResponse {
 	switch request.Method {